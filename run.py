@@ -1,6 +1,7 @@
 from __future__ import annotations
 import asyncio
 import os
+import sys
 from openai import AsyncOpenAI
 from agents import (
     Agent,
@@ -10,8 +11,10 @@ from agents import (
     AgentHooks,
     Tool,
     RunContextWrapper,
+    RunConfig,
 )
 from agents import ItemHelpers
+from agents.run import CallModelData, ModelInputData
 from pathlib import Path
 from tools import (
     agent_update_plan,
@@ -22,6 +25,7 @@ from tools import (
     message_ask_user,
     message_email_user,
     file_read,
+    file_read_many,
     file_write,
     file_append_text,
     file_replace_text,
@@ -31,45 +35,73 @@ from tools import (
     file_copy,
     file_move,
     info_search_web,
-    _agent_state,
+    get_state,
     get_tool_description,
 )
-import json
+from functools import lru_cache
+import orjson
 from dotenv import load_dotenv
 
 load_dotenv()
 
 prompt_file = Path(__file__).parent / "prompt.txt"
-PROMPT = prompt_file.read_text()
+
+
+@lru_cache(maxsize=1)
+def _load_prompt(mtime: float) -> str:
+    return prompt_file.read_text()
+
+
+def get_prompt() -> str:
+    """Return the system prompt, re-reading prompt.txt only when it changes."""
+    return _load_prompt(prompt_file.stat().st_mtime)
+
+
+@lru_cache(maxsize=32)
+def _format_phase(phase_id: int, goal: str | None, phase: str) -> str:
+    return f"You are in phase {phase_id}, with the goal of {goal} and the current phase is {phase}. If this is empty, then create a plan first. If it is not empty, then continue with the current phase, and consider this as your main task."
 
 
 class StepPromptHook(AgentHooks):
     """
     Keeps the original prompt intact and idempotent.
+
+    The agent instructions are never mutated, so the provider can cache the
+    static prompt prefix. The current phase is instead appended to the model
+    input as a trailing system message by ``inject_phase``.
     """
 
     def __init__(self):
         self.current_phase_id: int | None = None
+        self.phase_instruction: str | None = None
 
     async def on_tool_end(
         self, context: RunContextWrapper, agent: Agent, tool: Tool, result: str
     ) -> None:
-        phase_id = _agent_state["current_phase_id"]
+        state = get_state()
+        phase_id = state.current_phase_id
 
         if self.current_phase_id == phase_id:
             return
 
-        # Remove previous phase instruction if exists
-        if phase_id > 1:
-            last_phase = f"You are in phase {phase_id-1}, with the goal of {_agent_state['goal']} and the current phase is {_agent_state['phases'][phase_id-2]}. If this is empty, then create a plan first. If it is not empty, then continue with the current phase, and consider this as your main task."
-            if last_phase in agent.instructions:
-                agent.instructions = agent.instructions.replace(last_phase, "")
-
-        # Add current phase instruction
         self.current_phase_id = phase_id
-        current_phase = f"You are in phase {phase_id}, with the goal of {_agent_state['goal']} and the current phase is {_agent_state['phases'][phase_id-1]}. If this is empty, then create a plan first. If it is not empty, then continue with the current phase, and consider this as your main task."
-        agent.instructions = agent.instructions + "\n\n" + current_phase
-        # print(f"Updated prompt: {agent.instructions}")
+        # Phase entries are pydantic models (unhashable), so key on their text
+        self.phase_instruction = _format_phase(
+            phase_id, state.goal, str(state.phases[phase_id - 1])
+        )
+
+    def inject_phase(self, data: CallModelData) -> ModelInputData:
+        """``call_model_input_filter`` that appends the current phase instruction."""
+        model_data = data.model_data
+        if self.phase_instruction is None:
+            return model_data
+        return ModelInputData(
+            input=[
+                *model_data.input,
+                {"role": "system", "content": self.phase_instruction},
+            ],
+            instructions=model_data.instructions,
+        )
 
 
 def build_agent(client: AsyncOpenAI) -> Agent:
@@ -78,7 +110,7 @@ def build_agent(client: AsyncOpenAI) -> Agent:
 
     agent = Agent(
         name="DevAssistant",
-        instructions=(PROMPT),
+        instructions=get_prompt(),
         model=model_cfg,
         tools=[
             agent_update_plan,
@@ -89,6 +121,7 @@ def build_agent(client: AsyncOpenAI) -> Agent:
             message_ask_user,
             message_email_user,
             file_read,
+            file_read_many,
             file_write,
             file_append_text,
             file_replace_text,
@@ -106,6 +139,88 @@ def build_agent(client: AsyncOpenAI) -> Agent:
     return agent
 
 
+def build_run_config(agent: Agent) -> RunConfig:
+    """Return the RunConfig that sends *agent*'s current phase to the model.
+
+    Every run of an agent from ``build_agent`` must pass this config to the
+    Runner; without it the phase tracked by ``StepPromptHook`` is never sent.
+    """
+    hooks = agent.hooks
+    if not isinstance(hooks, StepPromptHook):
+        raise TypeError("build_run_config() expects an agent made by build_agent()")
+    return RunConfig(call_model_input_filter=hooks.inject_phase)
+
+
+###############################################################################
+# Stream event handlers — each returns True to stop consuming the stream      #
+###############################################################################
+
+_text_message_output = ItemHelpers.text_message_output
+# Each event is emitted with a single write. sys.stdout is looked up on every
+# call so that redirection after import (redirect_stdout, test capture) applies.
+
+
+def _on_agent_updated(event) -> bool:
+    # ── Handle agent switches (useful if you have multiple agents) ──────────
+    sys.stdout.write(f"\n── Switched to agent: {event.new_agent.name} ──\n\n")
+    return False
+
+
+def _on_tool_call(item) -> bool:
+    # Tool call started — print the code / arguments being sent.
+    raw = item.raw_item  # ResponseFunctionToolCall or ResponseCodeInterpreterToolCall
+
+    if raw.type == "code_interpreter_call":
+        sys.stdout.write(
+            f"====Code Interpreter Call=====\n{raw.code}\n"
+            "====End of Code Interpreter Call=====\n"
+        )
+        return False
+
+    name = raw.name
+    if name == "agent_end_task":
+        sys.stdout.write("====End of Task=====\n")
+        return True
+
+    # Use the tool_description_map to get a cleaner log message
+    arguments = getattr(raw, "arguments", "{}")
+    try:
+        args = orjson.loads(arguments or "{}")
+        description = get_tool_description(name, args)
+        sys.stdout.write(f"[Tool Call] {description}\n")
+    except Exception:
+        # Fallback to original behavior if there's an error
+        sys.stdout.write(f"[Tool Call] {name}\nArguments: {arguments}\n")
+    return False
+
+
+def _on_message_output(item) -> bool:
+    # Assistant sent (part of) a normal message.
+    sys.stdout.write(f"[Assistant] {_text_message_output(item)}\n")
+    return False
+
+
+# Tool outputs (e.g. stdout, images) are not printed; add a
+# "tool_call_output_item" handler here to show them.
+_ITEM_HANDLERS = {
+    "tool_call_item": _on_tool_call,
+    "message_output_item": _on_message_output,
+}
+
+
+def _on_run_item(event) -> bool:
+    # ── Handle the granular run‑item events ────────────────────────────────
+    item = event.item
+    handler = _ITEM_HANDLERS.get(item.type)
+    return handler is not None and handler(item)
+
+
+_EVENT_HANDLERS = {
+    "agent_updated_stream_event": _on_agent_updated,
+    "run_item_stream_event": _on_run_item,
+}
+
+
 async def run_demo() -> None:
     """Run a sample conversation and stream every event to the console."""
 
@@ -126,53 +241,19 @@ async def run_demo() -> None:
         }
     ]
 
-    stream = Runner.run_streamed(agent, messages, max_turns=70)
+    stream = Runner.run_streamed(
+        agent,
+        messages,
+        max_turns=70,
+        run_config=build_run_config(agent),
+    )
 
+    handlers_get = _EVENT_HANDLERS.get
     async for event in stream.stream_events():
-        # ── Handle agent switches (useful if you have multiple agents) ──────────
-        if event.type == "agent_updated_stream_event":
-            print(f"\n── Switched to agent: {event.new_agent.name} ──\n")
-            continue
-
-        # ── Handle the granular run‑item events ────────────────────────────────
-        if event.type == "run_item_stream_event":
-            item = event.item
-
-            # Tool call started — print the code / arguments being sent.
-            if item.type == "tool_call_item":
-                raw = (
-                    item.raw_item
-                )  # ResponseFunctionToolCall or ResponseCodeInterpreterToolCall
-
-                if raw.type == "code_interpreter_call":
-                    print("====Code Interpreter Call=====")
-                    print(raw.code)
-                    print("====End of Code Interpreter Call=====")
-                else:
-                    if raw.name == "agent_end_task":
-                        print("====End of Task=====")
-                        break
-
-                    # Use the tool_description_map to get a cleaner log message
-                    try:
-                        args = json.loads(getattr(raw, "arguments", "{}"))
-                        description = get_tool_description(raw.name, args)
-                        print(f"[Tool Call] {description}")
-                    except Exception:
-                        # Fallback to original behavior if there's an error
-                        print(f"[Tool Call] {raw.name}")
-                        print(f"Arguments: {getattr(raw, 'arguments', '{}')}")
-
-            # Tool produced its output — e.g. stdout, images, etc.
-            # elif item.type == "tool_call_output_item":
-            #     print("[Tool Output]")
-            #     print(item.output)
-            #     print()
-
-            # Assistant sent (part of) a normal message.
-            elif item.type == "message_output_item":
-                msg_text = ItemHelpers.text_message_output(item)
-                print("[Assistant]", msg_text)
+        handler = handlers_get(event.type)
+        if handler is not None and handler(event):
+            break
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
@@ -1,57 +1,113 @@
 # agent_tools.py
 """Utility module providing Agent Management, Messaging, and File System tools.
 
-Each function mirrors the signature and behavior requested. Agent-related state is
-kept in an in-memory dictionary; message tools are stubs you can integrate with
-real notification services later. File system tools wrap the Python standard
-library with basic error handling.
+Each function mirrors the signature and behavior requested. Agent-related state
+is kept in memory in an ``AgentState`` slotted class guarded by ``_state_lock``;
+message tools are stubs you can integrate with real notification services
+later. File system tools wrap the Python standard library with basic error
+handling; the blocking work runs in a worker thread so that parallel tool calls
+overlap instead of stalling the event loop.
 """
 
 from __future__ import annotations
 
+import asyncio
+import atexit
 import os
 import shutil
 import smtplib
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
 from email.message import EmailMessage
 from pathlib import Path
 from typing import List, Dict, Optional
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 from agents import function_tool
 from pydantic import BaseModel
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 ###############################################################################
 # Agent‑level state (kept simple & in‑memory for illustration)                #
 ###############################################################################
 
-_agent_state: Dict[str, Optional[object]] = {
-    "current_phase_id": None,
-    "goal": None,
-    "phases": [],
-    "completed": False,
-    "scheduled_tasks": [],  # list of dicts
-}
 
-# Tool description map for logging and UI feedback
+class AgentState:
+    # Explicit __slots__ rather than dataclass(slots=True), which needs Python 3.10
+    __slots__ = ("current_phase_id", "goal", "phases", "completed", "scheduled_tasks")
+
+    def __init__(
+        self,
+        current_phase_id: Optional[int] = None,
+        goal: Optional[str] = None,
+        phases: Optional[List[Phase]] = None,
+        completed: bool = False,
+        scheduled_tasks: Optional[List[dict]] = None,
+    ) -> None:
+        self.current_phase_id = current_phase_id
+        self.goal = goal
+        self.phases = phases if phases is not None else []
+        self.completed = completed
+        self.scheduled_tasks = scheduled_tasks if scheduled_tasks is not None else []
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"AgentState({fields})"
+
+
+# Tools may run concurrently (parallel tool calls, worker threads), so every
+# read-modify-write of the state happens under this lock.
+_state_lock = threading.Lock()
+_agent_state = AgentState()
+
+
+def get_state() -> AgentState:
+    """Return a consistent snapshot of the agent state."""
+    with _state_lock:
+        return AgentState(
+            current_phase_id=_agent_state.current_phase_id,
+            goal=_agent_state.goal,
+            phases=list(_agent_state.phases),
+            completed=_agent_state.completed,
+            scheduled_tasks=list(_agent_state.scheduled_tasks),
+        )
+
+
+# Tool description map for logging and UI feedback: (format string, argument keys)
 tool_description_map = {
-    "file_write": lambda args: f"Creating file {args.get('path')}",
-    "file_replace_text": lambda args: f"Editing file {args.get('path')}",
-    "file_append_text": lambda args: f"Adding content to file {args.get('path')}",
-    "file_delete": lambda args: f"Deleting file {args.get('path')}",
-    "file_read": lambda args: f"Reading file {args.get('file')}",
-    "file_list": lambda args: f"Listing contents of directory {args.get('path')}",
-    "file_make_dir": lambda args: f"Creating directory {args.get('path')}",
-    "file_copy": lambda args: f"Copying {args.get('source')} to {args.get('destination')}",
-    "file_move": lambda args: f"Moving {args.get('source')} to {args.get('destination')}",
-    "agent_update_plan": lambda args: "Updating task plan",
-    "agent_advance_phase": lambda args: f"Advancing from phase {args.get('from_phase_id')} to {args.get('to_phase_id')}",
-    "agent_end_task": lambda args: "Ending current task",
-    "agent_schedule_task": lambda args: f"Scheduling task: {args.get('task_description')}",
-    "message_notify_user": lambda args: "Sending notification to user",
-    "message_ask_user": lambda args: "Asking user for input",
-    "message_email_user": lambda args: f"Sending email to {args.get('recipient')}",
-    "info_search_web": lambda args: f"Searching web for: {args.get('query')}",
+    "file_write": ("Creating file {path}", ("path",)),
+    "file_replace_text": ("Editing file {path}", ("path",)),
+    "file_append_text": ("Adding content to file {path}", ("path",)),
+    "file_delete": ("Deleting file {path}", ("path",)),
+    "file_read": ("Reading file {file}", ("file",)),
+    "file_read_many": ("Reading files {files}", ("files",)),
+    "file_list": ("Listing contents of directory {path}", ("path",)),
+    "file_make_dir": ("Creating directory {path}", ("path",)),
+    "file_copy": ("Copying {source} to {destination}", ("source", "destination")),
+    "file_move": ("Moving {source} to {destination}", ("source", "destination")),
+    "agent_update_plan": ("Updating task plan", ()),
+    "agent_advance_phase": (
+        "Advancing from phase {from_phase_id} to {to_phase_id}",
+        ("from_phase_id", "to_phase_id"),
+    ),
+    "agent_end_task": ("Ending current task", ()),
+    "agent_schedule_task": (
+        "Scheduling task: {task_description}",
+        ("task_description",),
+    ),
+    "message_notify_user": ("Sending notification to user", ()),
+    "message_ask_user": ("Asking user for input", ()),
+    "message_email_user": ("Sending email to {recipient}", ("recipient",)),
+    "info_search_web": ("Searching web for: {query}", ("query",)),
 }
 
 ###############################################################################
@@ -92,20 +148,24 @@ def agent_update_plan(
     - Actively update the task plan when significant new information emerges (e.g. a need for deeper investigation)
 
     """
-    if current_phase_id is not None:
-        _agent_state["current_phase_id"] = current_phase_id
+    with _state_lock:
+        if current_phase_id is not None:
+            _agent_state.current_phase_id = current_phase_id
+
+        if goal is not None:
+            _agent_state.goal = goal
+        if phases is not None:
+            _agent_state.phases = phases
 
-    if goal is not None:
-        _agent_state["goal"] = goal
-    if phases is not None:
-        _agent_state["phases"] = phases
+        goal, phases = _agent_state.goal, _agent_state.phases
+        current_phase_id = _agent_state.current_phase_id
 
     print(
-        f"Task plan updated:\n<task_plan>\nGoal:\n{_agent_state['goal']}\n\nCurrent phase:\n{_agent_state['current_phase_id']}\n</task_plan>\n"
+        f"Task plan updated:\n<task_plan>\nGoal:\n{goal}\n\nCurrent phase:\n{current_phase_id}\n</task_plan>\n"
     )
 
     return {
-        "response": f"Task plan updated:\n<task_plan>\nGoal:\n{_agent_state['goal']}\n\nPhases:\n{_agent_state['phases']}\n\nCurrent phase:\n{_agent_state['current_phase_id']}\n</task_plan>\n"
+        "response": f"Task plan updated:\n<task_plan>\nGoal:\n{goal}\n\nPhases:\n{phases}\n\nCurrent phase:\n{current_phase_id}\n</task_plan>\n"
     }
 
 
@@ -122,14 +182,16 @@ def agent_advance_phase(*, from_phase_id: int, to_phase_id: int) -> None:
     - `to_phase_id` MUST be the next sequential ID after `from_phase_id`, skipping phases or going backward is NOT allowed
     - If skipping phases or going backward is needed, it indicates the task plan needs updating, and MUST use the `agent_update_plan` tool
     """
-    if _agent_state["current_phase_id"] != from_phase_id:
-        raise ValueError(
-            f"Cannot advance: agent is in phase {_agent_state['current_phase_id']}, not {from_phase_id}."
-        )
-    _agent_state["current_phase_id"] = to_phase_id
+    with _state_lock:
+        if _agent_state.current_phase_id != from_phase_id:
+            raise ValueError(
+                f"Cannot advance: agent is in phase {_agent_state.current_phase_id}, not {from_phase_id}."
+            )
+        _agent_state.current_phase_id = to_phase_id
+        goal, phases = _agent_state.goal, _agent_state.phases
     print(f"[Agent] Advanced from phase {from_phase_id} ➡ {to_phase_id}")
     return {
-        "response": f"Advanced to the next phase:\n<task_plan>\nGoal:\n{_agent_state['goal']}\n\nPhases:\n{_agent_state['phases']}\n\nPrevious phase: {_agent_state['current_phase_id']}\n\nNext phase: {to_phase_id}\n</task_plan>\n<best_practices>\n[Relevant best practices for the new phase]\n</best_practices>\n<related_knowledge>\n[Relevant knowledge for the new phase]\n</related_knowledge>"
+        "response": f"Advanced to the next phase:\n<task_plan>\nGoal:\n{goal}\n\nPhases:\n{phases}\n\nPrevious phase: {from_phase_id}\n\nNext phase: {to_phase_id}\n</task_plan>\n<best_practices>\n[Relevant best practices for the new phase]\n</best_practices>\n<related_knowledge>\n[Relevant knowledge for the new phase]\n</related_knowledge>"
     }
 
 
@@ -147,7 +209,8 @@ def agent_end_task() -> None:
     - DO NOT use this tool when failed to complete a task; instead, use the `message_ask_user` tool to ask for guidance
     - DO NOT use this tool when the user changes task or presents new requirement; instead, update the task plan directly
     """
-    _agent_state["completed"] = True
+    with _state_lock:
+        _agent_state.completed = True
     print("[Agent] Task marked as completed.")
     return {"response": "ok"}
 
@@ -171,13 +234,14 @@ def agent_schedule_task(
             "start_time must be in ISO format, e.g. '2025-06-18 09:00:00'"
         ) from exc
 
-    _agent_state["scheduled_tasks"].append(
-        {
-            "task_description": task_description,
-            "schedule_type": schedule_type,
-            "start_time": start_dt,
-        }
-    )
+    with _state_lock:
+        _agent_state.scheduled_tasks.append(
+            {
+                "task_description": task_description,
+                "schedule_type": schedule_type,
+                "start_time": start_dt,
+            }
+        )
     print(
         f"[Agent] Scheduled task '{task_description}' ({schedule_type}) starting at {start_dt}."
     )
@@ -258,6 +322,55 @@ def message_ask_user(
     return input(prompt)
 
 
+@lru_cache(maxsize=1)
+def _email_from() -> str:
+    """Sender address, looked up on first send (after .env is loaded) and cached."""
+    return os.getenv("EMAIL_FROM", "noreply@example.com")
+
+
+# Pooled SMTP connection reused across message_email_user calls
+_smtp: Optional[smtplib.SMTP] = None
+_smtp_lock = threading.Lock()
+
+
+def _drop_smtp() -> None:
+    """Close the pooled SMTP connection, if any. Caller holds ``_smtp_lock``."""
+    global _smtp
+    if _smtp is not None:
+        try:
+            _smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            pass
+        _smtp = None
+
+
+def _get_smtp() -> smtplib.SMTP:
+    """Return a live SMTP connection, reconnecting if the pooled one died.
+
+    Caller holds ``_smtp_lock``.
+    """
+    global _smtp
+    if _smtp is not None:
+        try:
+            if _smtp.noop()[0] == 250:
+                return _smtp
+        except (smtplib.SMTPException, OSError):
+            pass
+        _drop_smtp()
+    smtp_host = os.getenv("EMAIL_SMTP_HOST", "localhost")
+    smtp_port = int(os.getenv("EMAIL_SMTP_PORT", "25"))
+    _smtp = smtplib.SMTP(smtp_host, smtp_port)
+    return _smtp
+
+
+def _close_smtp() -> None:
+    with _smtp_lock:
+        _drop_smtp()
+
+
+atexit.register(_close_smtp)
+
+
 @function_tool
 def message_email_user(*, recipient: str, subject: str, body: str) -> None:
     """Send an email to the recipient.
@@ -266,15 +379,13 @@ def message_email_user(*, recipient: str, subject: str, body: str) -> None:
     """
     msg = EmailMessage()
     msg["To"] = recipient
-    msg["From"] = os.getenv("EMAIL_FROM", "noreply@example.com")
+    msg["From"] = _email_from()
     msg["Subject"] = subject
     msg.set_content(body)
 
     try:
-        smtp_host = os.getenv("EMAIL_SMTP_HOST", "localhost")
-        smtp_port = int(os.getenv("EMAIL_SMTP_PORT", "25"))
-        with smtplib.SMTP(smtp_host, smtp_port) as smtp:
-            smtp.send_message(msg)
+        with _smtp_lock:
+            _get_smtp().send_message(msg)
         print(f"[Email] Sent to {recipient}: {subject}")
     except Exception as exc:
         print(f"[Email] Failed to send: {exc}")
@@ -287,13 +398,51 @@ def message_email_user(*, recipient: str, subject: str, body: str) -> None:
 # Helper
 
 
+@lru_cache(maxsize=1024)
+def _resolve_absolute(path: str) -> Path:
+    return Path(path).resolve()
+
+
 def _resolve(path: str | Path) -> Path:
-    """Return an absolute, expanded *Path* object for **path**."""
-    return Path(os.path.expanduser(path)).resolve()
+    """Return an absolute, expanded *Path* object for **path**.
+
+    Absolute paths are cached; relative ones depend on the working directory and
+    are resolved every time. Tools that can change what a path resolves to
+    (delete, move) clear the cache afterwards.
+    """
+    expanded = os.path.expanduser(path)
+    if os.path.isabs(expanded):
+        return _resolve_absolute(expanded)
+    return Path(expanded).resolve()
+
+
+def _read_file(file: str, start_line: Optional[int], end_line: Optional[int]) -> str:
+    p = _resolve(file)
+
+    if not p.exists():
+        raise FileNotFoundError(f"File not found: {file}")
+
+    if start_line is None and end_line is None:
+        return p.read_text()
+
+    # Only materialise the requested slice; stop reading once end_line is hit
+    start = start_line if start_line is not None else 0
+    with p.open() as fh:
+        if start >= 0 and (end_line is None or start < end_line):
+            lines = list(islice(fh, start, end_line))
+            if lines and (end_line is None or len(lines) == end_line - start):
+                return "\n".join(line.removesuffix("\n") for line in lines)
+        # Out of range: count the lines only to report them in the error
+        fh.seek(0)
+        total = sum(1 for _ in fh)
+
+    raise ValueError(
+        f"Invalid line range: start_line={start_line}, end_line={end_line}, file has {total} lines"
+    )
 
 
 @function_tool
-def file_read(
+async def file_read(
     *,
     file: str,
     start_line: Optional[int] = None,
@@ -310,30 +459,61 @@ def file_read(
     - Use line range limits appropriately; when uncertain, start by reading first 20 lines
     - Be mindful of performance impact with large files
     """
-    p = _resolve(file)
+    return await asyncio.to_thread(_read_file, file, start_line, end_line)
 
-    if not p.exists():
-        raise FileNotFoundError(f"File not found: {file}")
 
-    content = p.read_text()
+@function_tool
+async def file_read_many(*, files: List[str]) -> Dict[str, str]:
+    """Read the full content of several text files at once.
 
-    if start_line is not None or end_line is not None:
-        lines = content.splitlines()
-        start = start_line if start_line is not None else 0
-        end = end_line if end_line is not None else len(lines)
+    When to use:
+    - When the content of more than one known file is needed at the same time
 
-        if start < 0 or end > len(lines) or start >= end:
-            raise ValueError(
-                f"Invalid line range: start_line={start_line}, end_line={end_line}, file has {len(lines)} lines"
-            )
+    Best practices:
+    - Prefer this over multiple `file_read` calls when all the paths are known up front
+    - Use `file_read` with line ranges instead for large files
+    - A file that cannot be read maps to an error message instead of its content
+    """
+    results = await asyncio.gather(
+        *(asyncio.to_thread(_read_file, f, None, None) for f in files),
+        return_exceptions=True,
+    )
+    return {
+        f: f"Error: {result}" if isinstance(result, Exception) else result
+        for f, result in zip(files, results)
+    }
 
-        content = "\n".join(lines[start:end])
 
-    return content
+def _has_content(p: Path, data: bytes) -> bool:
+    """Return True if the file at *p* already holds exactly **data**."""
+    try:
+        if p.stat().st_size != len(data):
+            return False
+        view = memoryview(data)
+        offset = 0
+        with p.open("rb") as fh:
+            while chunk := fh.read(1 << 20):
+                if view[offset : offset + len(chunk)] != chunk:
+                    return False
+                offset += len(chunk)
+    except (FileNotFoundError, IsADirectoryError):
+        return False
+    return offset == len(data)
+
+
+def _write_file(path: str, content: str) -> bool:
+    """Write **content** to *path*; return False if the file was already identical."""
+    p = _resolve(path)
+    data = content.encode("utf-8")
+    if _has_content(p, data):
+        return False
+    p.parent.mkdir(parents=True, exist_ok=True)
+    p.write_bytes(data)
+    return True
 
 
 @function_tool
-def file_write(*, path: str, content: str) -> None:
+async def file_write(*, path: str, content: str) -> None:
     """Overwrite the content of a text file.
 
     When to use:
@@ -344,14 +524,20 @@ def file_write(*, path: str, content: str) -> None:
     - Strictly follow requirements in <writing_guidelines> and other best practices
     - Avoid using list formats in any files except todo.md
     - DO NOT output snipped or truncated content, always output full content"""
+    if not await asyncio.to_thread(_write_file, path, content):
+        return {"response": f"File unchanged: {path}"}
+    return {"response": f"File written: {path}"}
+
+
+def _append_file(path: str, content: str) -> None:
     p = _resolve(path)
     p.parent.mkdir(parents=True, exist_ok=True)
-    p.write_text(content)
-    return {"response": f"File written: {path}"}
+    with p.open("a", encoding="utf-8") as fh:
+        fh.write(content)
 
 
 @function_tool
-def file_append_text(*, path: str, content: str) -> None:
+async def file_append_text(*, path: str, content: str) -> None:
     """Append content to a text file.
 
     When to use:
@@ -362,15 +548,40 @@ def file_append_text(*, path: str, content: str) -> None:
     - Avoid using list formats in any files except todo.md
     - DO NOT output snipped or truncated content, always output full content
     """
-    p = _resolve(path)
-    p.parent.mkdir(parents=True, exist_ok=True)
-    with p.open("a", encoding="utf-8") as fh:
-        fh.write(content)
+    await asyncio.to_thread(_append_file, path, content)
     return {"response": f"File appended: {path}"}
 
 
+def _atomic_write_text(p: Path, content: str) -> None:
+    """Write **content** to *p* via a temp file + rename so *p* is never partial."""
+    fd, tmp = tempfile.mkstemp(dir=p.parent, prefix=f".{p.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as fh:
+            fh.write(content)
+        shutil.copymode(p, tmp)
+        os.replace(tmp, p)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _replace_in_file(path: str, old_text: str, new_text: str) -> None:
+    p = _resolve(path)
+    content = p.read_text()
+    # Locate the match and stop at a second one rather than counting them all
+    start = content.find(old_text)
+    if start == -1:
+        return
+    end = start + len(old_text)
+    if content.find(old_text, end) != -1:
+        raise ValueError(
+            f"Error: '{old_text}' appears multiple times in the file. Please provide a more specific old_text to avoid ambiguity."
+        )
+    _atomic_write_text(p, content[:start] + new_text + content[end:])
+
+
 @function_tool
-def file_replace_text(*, path: str, old_text: str, new_text: str) -> None:
+async def file_replace_text(*, path: str, old_text: str, new_text: str) -> None:
     """Replace specified string in a text file.
 
     When to use:
@@ -382,61 +593,111 @@ def file_replace_text(*, path: str, old_text: str, new_text: str) -> None:
     - The `old_str` parameter MUST exactly match one or more consecutive lines in the source file
     - If `old_text` appears multiple times in the source file, an error will be raised
     """
-    p = _resolve(path)
-    content = p.read_text()
-    if content.count(old_text) > 1:
-        raise ValueError(
-            f"Error: '{old_text}' appears multiple times in the file. Please provide a more specific old_text to avoid ambiguity."
-        )
-    p.write_text(content.replace(old_text, new_text))
+    await asyncio.to_thread(_replace_in_file, path, old_text, new_text)
     return {
         "response": f"File edited: {path}, Latest content with line numbers: {new_text}"
     }
 
 
+def _delete_path(path: str) -> None:
+    p = _resolve(path)
+    try:
+        if p.is_dir():
+            shutil.rmtree(p)
+        else:
+            p.unlink(missing_ok=True)
+    finally:
+        _resolve_absolute.cache_clear()
+
+
 @function_tool
-def file_delete(*, path: str) -> None:
+async def file_delete(*, path: str) -> None:
     """Delete the file at *path*."""
-    p = _resolve(path)
-    if p.is_dir():
-        shutil.rmtree(p)
-    else:
-        p.unlink(missing_ok=True)
+    await asyncio.to_thread(_delete_path, path)
     return {"response": f"File deleted: {path}"}
 
 
+def _list_dir(path: str) -> List[str]:
+    with os.scandir(_resolve(path)) as it:
+        return [entry.path for entry in it]
+
+
 @function_tool
-def file_list(*, path: str) -> List[str]:
+async def file_list(*, path: str) -> List[str]:
     """Return a list of files/directories in *path*."""
-    p = _resolve(path)
-    return [str(child) for child in p.iterdir()]
+    return await asyncio.to_thread(_list_dir, path)
+
+
+def _make_dir(path: str) -> None:
+    _resolve(path).mkdir(parents=True, exist_ok=True)
 
 
 @function_tool
-def file_make_dir(*, path: str) -> None:
+async def file_make_dir(*, path: str) -> None:
     """Create a directory (and parents) at *path*."""
-    _resolve(path).mkdir(parents=True, exist_ok=True)
+    await asyncio.to_thread(_make_dir, path)
     return {"response": f"Directory created: {path}"}
 
 
-@function_tool
-def file_copy(*, source: str, destination: str) -> None:
-    """Copy *source* to *destination* (file or directory)."""
+def _clone_tree(src: Path, dst: Path) -> bool:
+    """Copy the contents of *src* into *dst* with ``cp --reflink=auto``.
+
+    On copy-on-write filesystems (btrfs, xfs, ...) this clones extents instead
+    of copying bytes. Returns False when cp is unavailable, the trees live on
+    different filesystems, or the copy fails, so the caller can fall back.
+    Hardlinks are deliberately not used: file_write edits files in place and
+    would silently modify the source as well.
+    """
+    if sys.platform != "linux" or shutil.which("cp") is None:
+        return False
+    dst.mkdir(parents=True, exist_ok=True)
+    if src.stat().st_dev != dst.stat().st_dev:
+        return False
+    result = subprocess.run(
+        [
+            "cp",
+            "-R",
+            "-L",
+            "--reflink=auto",
+            "--preserve=mode,timestamps",
+            f"{src}/.",
+            str(dst),
+        ],
+        capture_output=True,
+    )
+    return result.returncode == 0
+
+
+def _copy_path(source: str, destination: str) -> None:
     src, dst = _resolve(source), _resolve(destination)
     if src.is_dir():
-        shutil.copytree(src, dst, dirs_exist_ok=True)
+        if not _clone_tree(src, dst):
+            shutil.copytree(src, dst, dirs_exist_ok=True)
     else:
         dst.parent.mkdir(parents=True, exist_ok=True)
         shutil.copy2(src, dst)
-    return {"response": f"File copied: {source} to {destination}"}
 
 
 @function_tool
-def file_move(*, source: str, destination: str) -> None:
-    """Move *source* to *destination* (file or directory)."""
+async def file_copy(*, source: str, destination: str) -> None:
+    """Copy *source* to *destination* (file or directory)."""
+    await asyncio.to_thread(_copy_path, source, destination)
+    return {"response": f"File copied: {source} to {destination}"}
+
+
+def _move_path(source: str, destination: str) -> None:
     src, dst = _resolve(source), _resolve(destination)
     dst.parent.mkdir(parents=True, exist_ok=True)
-    shutil.move(src, dst)
+    try:
+        shutil.move(src, dst)
+    finally:
+        _resolve_absolute.cache_clear()
+
+
+@function_tool
+async def file_move(*, source: str, destination: str) -> None:
+    """Move *source* to *destination* (file or directory)."""
+    await asyncio.to_thread(_move_path, source, destination)
     return {"response": f"File moved: {source} to {destination}"}
 
 
@@ -456,25 +717,75 @@ def get_tool_description(tool_name: str, args: dict) -> str:
     Returns:
         A formatted string describing what the tool is doing
     """
-    if tool_name in tool_description_map:
-        return tool_description_map[tool_name](args)
-    return f"Using tool: {tool_name}"
-
-
-@function_tool
-def info_search_web(query: str, date_range: str = "all", num: int = 5) -> dict:
-    """
-    Search web pages using Google Custom Search API.
-
-    Args:
-        query (str): Search query in Google search style, using 3-5 keywords.
-        date_range (str): Optional time filter ('all', 'past_hour', 'past_day', 'past_week', 'past_month', 'past_year').
-        num (int): Number of results to return (default 5).
+    entry = tool_description_map.get(tool_name)
+    if entry is None:
+        return f"Using tool: {tool_name}"
+    fmt, keys = entry
+    if not keys:
+        return fmt
+    return fmt.format_map({key: args.get(key, "") for key in keys})
+
+
+# Shared HTTP session so repeated searches reuse the pooled TLS connection
+_http = requests.Session()
+_http.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=8,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False,
+        ),
+    ),
+)
+atexit.register(_http.close)
+
+# TTL LRU of search results keyed on (query, date_range, num), plus the searches
+# currently in flight so concurrent identical calls share one API request. Only
+# touched from the event loop thread, so no lock is needed around them.
+_SEARCH_CACHE_TTL = 300.0
+_SEARCH_CACHE_MAXSIZE = 256
+_search_cache: OrderedDict[tuple, tuple[float, dict]] = OrderedDict()
+_search_inflight: Dict[tuple, asyncio.Task] = {}
+_search_cache_stats: Dict[str, int] = {"hits": 0, "misses": 0}
+
+
+def search_cache_stats() -> Dict[str, int]:
+    """Return hit/miss counts and the current size of the web search cache."""
+    return {**_search_cache_stats, "size": len(_search_cache)}
+
+
+def _search_cache_get(key: tuple) -> Optional[dict]:
+    entry = _search_cache.get(key)
+    if entry is None or entry[0] < time.monotonic():
+        _search_cache.pop(key, None)
+        return None
+    _search_cache.move_to_end(key)
+    return entry[1]
+
+
+def _search_cache_put(key: tuple, value: dict) -> None:
+    _search_cache[key] = (time.monotonic() + _SEARCH_CACHE_TTL, value)
+    _search_cache.move_to_end(key)
+    while len(_search_cache) > _SEARCH_CACHE_MAXSIZE:
+        _search_cache.popitem(last=False)
+
+
+def _fetch_search(url: str, params: dict) -> bytes:
+    """GET *url* and return the body; on errors only the first 512 bytes are read."""
+    with _http.get(url, params=params, timeout=10, stream=True) as response:
+        if response.status_code != 200:
+            snippet = next(response.iter_content(512), b"")
+            raise Exception(
+                f"Google Custom Search API error: {response.status_code}, {snippet!r}"
+            )
+        return response.content
 
-    Returns:
-        dict: The search results from Google Custom Search API.
-    """
 
+async def _search_web(query: str, date_range: str, num: int) -> dict:
     api_key = os.getenv("GOOGLE_API_KEY", "Your Google API Key")
     cx = os.getenv("GOOGLE_SEARCH_CX", "")
     url = "https://www.googleapis.com/customsearch/v1"
@@ -493,11 +804,39 @@ def info_search_web(query: str, date_range: str = "all", num: int = 5) -> dict:
         if date_range in date_restrict_map:
             params["dateRestrict"] = date_restrict_map[date_range]
 
-    response = requests.get(url, params=params)
+    body = await asyncio.to_thread(_fetch_search, url, params)
+    result = orjson.loads(body)
+    _search_cache_put((query, date_range, num), result)
+    return result
 
-    if response.status_code != 200:
-        raise Exception(
-            f"Google Custom Search API error: {response.status_code}, {response.text}"
-        )
 
-    return response.json()
+@function_tool
+async def info_search_web(query: str, date_range: str = "all", num: int = 5) -> dict:
+    """
+    Search web pages using Google Custom Search API.
+
+    Args:
+        query (str): Search query in Google search style, using 3-5 keywords.
+        date_range (str): Optional time filter ('all', 'past_hour', 'past_day', 'past_week', 'past_month', 'past_year').
+        num (int): Number of results to return (default 5).
+
+    Returns:
+        dict: The search results from Google Custom Search API.
+    """
+    cache_key = (query, date_range, num)
+    cached = _search_cache_get(cache_key)
+    if cached is not None:
+        _search_cache_stats["hits"] += 1
+        return cached
+
+    task = _search_inflight.get(cache_key)
+    if task is not None:
+        _search_cache_stats["hits"] += 1
+    else:
+        _search_cache_stats["misses"] += 1
+        task = asyncio.ensure_future(_search_web(query, date_range, num))
+        _search_inflight[cache_key] = task
+        task.add_done_callback(lambda _: _search_inflight.pop(cache_key, None))
+
+    # Shield so that one caller being cancelled does not cancel the shared search
+    return await asyncio.shield(task)